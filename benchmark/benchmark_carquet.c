@@ -201,6 +201,36 @@ static double benchmark_read(const char* filename, int expected_rows) {
     return get_time_ms() - start;
 }
 
+static int compare_double(const void* a, const void* b) {
+    double diff = *(const double*)a - *(const double*)b;
+    return (diff > 0) - (diff < 0);
+}
+
+/* min / median / population stdev over a timing array (matches the stats
+ * the PyArrow benchmark reports, so results.csv rows stay uniform) */
+static void timing_stats(const double* times, int n,
+                         double* min_out, double* med_out, double* std_out) {
+    double sorted[BENCH_ITERATIONS];
+    memcpy(sorted, times, n * sizeof(double));
+    qsort(sorted, n, sizeof(double), compare_double);
+
+    *min_out = sorted[0];
+    *med_out = (n % 2 == 1) ? sorted[n / 2]
+                            : (sorted[n / 2 - 1] + sorted[n / 2]) / 2.0;
+
+    double mean = 0;
+    for (int i = 0; i < n; i++) {
+        mean += times[i];
+    }
+    mean /= n;
+
+    double var = 0;
+    for (int i = 0; i < n; i++) {
+        var += (times[i] - mean) * (times[i] - mean);
+    }
+    *std_out = sqrt(var / n);
+}
+
 static void run_benchmark(const char* dataset_name, int num_rows,
                           carquet_compression_t codec, const char* compression_name) {
     char filename[256];
@@ -237,14 +267,22 @@ static void run_benchmark(const char* dataset_name, int num_rows,
     double rows_per_sec_write = (num_rows / write_avg) * 1000;
     double rows_per_sec_read = (num_rows / read_avg) * 1000;
 
-    printf("  Write: %.2f ms (%.2f M rows/sec)\n", write_avg, rows_per_sec_write / 1e6);
-    printf("  Read:  %.2f ms (%.2f M rows/sec)\n", read_avg, rows_per_sec_read / 1e6);
+    double write_min, write_med, write_std;
+    double read_min, read_med, read_std;
+    timing_stats(write_times, BENCH_ITERATIONS, &write_min, &write_med, &write_std);
+    timing_stats(read_times, BENCH_ITERATIONS, &read_min, &read_med, &read_std);
+
+    printf("  Write: %.2f ms (%.2f M rows/sec) [min %.2f / med %.2f / std %.2f]\n",
+           write_avg, rows_per_sec_write / 1e6, write_min, write_med, write_std);
+    printf("  Read:  %.2f ms (%.2f M rows/sec) [min %.2f / med %.2f / std %.2f]\n",
+           read_avg, rows_per_sec_read / 1e6, read_min, read_med, read_std);
     printf("  File:  %.2f MB (%.2f bytes/row)\n",
            file_size / (1024.0 * 1024.0), (double)file_size / num_rows);
 
-    // Output CSV line for parsing
-    printf("CSV:carquet,%s,%s,%d,%.2f,%.2f,%ld\n",
-           dataset_name, compression_name, num_rows, write_avg, read_avg, file_size);
+    // Output CSV line for parsing (same 13 columns as benchmark_pyarrow.py)
+    printf("CSV:carquet,%s,%s,%d,%.2f,%.2f,%ld,%.2f,%.2f,%.2f,%.2f,%.2f,%.2f\n",
+           dataset_name, compression_name, num_rows, write_avg, read_avg, file_size,
+           write_min, write_med, write_std, read_min, read_med, read_std);
 
     remove(filename);
 }
@@ -55,7 +55,7 @@ fi
 
 # Create results file
 RESULTS_FILE="${SCRIPT_DIR}/results.csv"
-echo "library,dataset,compression,rows,write_ms,read_ms,file_bytes" > "${RESULTS_FILE}"
+echo "library,dataset,compression,rows,write_ms,read_ms,file_bytes,write_min_ms,write_med_ms,write_std_ms,read_min_ms,read_med_ms,read_std_ms" > "${RESULTS_FILE}"
 
 echo ""
 echo "Running Carquet benchmark..."
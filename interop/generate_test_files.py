@@ -12,6 +12,7 @@ Usage:
 import os
 import sys
 import json
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from decimal import Decimal
 
@@ -19,6 +20,7 @@ from decimal import Decimal
 AVAILABLE_LIBS = {}
 
 try:
+    import numpy as np
     import pyarrow as pa
     import pyarrow.parquet as pq
     AVAILABLE_LIBS['pyarrow'] = pa.__version__
@@ -44,6 +46,19 @@ except ImportError:
     print("Warning: fastparquet not available")
 
 
+def make_large_table(n):
+    """Build the synthetic id/value/category table with PyArrow."""
+    # Category as a dictionary array: 100 unique strings plus vectorized
+    # indices, instead of formatting n Python strings one by one.
+    cat_values = pa.array([f'cat_{k}' for k in range(100)], type=pa.string())
+    cat_indices = pa.array(np.arange(n, dtype=np.int32) % 100)
+    return pa.table({
+        'id': pa.array(np.arange(n, dtype=np.int64)),
+        'value': pa.array(np.random.randn(n), type=pa.float64()),
+        'category': pa.DictionaryArray.from_arrays(cat_indices, cat_values),
+    })
+
+
 def generate_pyarrow_files(output_dir: Path):
     """Generate test files using PyArrow."""
     if 'pyarrow' not in AVAILABLE_LIBS:
@@ -53,8 +68,7 @@ def generate_pyarrow_files(output_dir: Path):
     pa_dir = output_dir / "pyarrow"
     pa_dir.mkdir(exist_ok=True)
 
-    # 1. Basic types - uncompressed
-    print("  Generating: basic_types_uncompressed.parquet")
+    # 1-5. Basic types - one table, written once per compression codec
     table = pa.table({
         'int32_col': pa.array([1, 2, 3, None, 5], type=pa.int32()),
         'int64_col': pa.array([100, 200, 300, 400, None], type=pa.int64()),
@@ -63,52 +77,43 @@ def generate_pyarrow_files(output_dir: Path):
         'bool_col': pa.array([True, False, True, None, False], type=pa.bool_()),
         'string_col': pa.array(['hello', 'world', None, 'test', 'data'], type=pa.string()),
     })
-    path = pa_dir / "basic_types_uncompressed.parquet"
-    pq.write_table(table, path, compression='NONE')
-    files.append(('basic_types_uncompressed', str(path), 'pyarrow', 'NONE'))
-
-    # 2. Basic types - SNAPPY
-    print("  Generating: basic_types_snappy.parquet")
-    path = pa_dir / "basic_types_snappy.parquet"
-    pq.write_table(table, path, compression='SNAPPY')
-    files.append(('basic_types_snappy', str(path), 'pyarrow', 'SNAPPY'))
-
-    # 3. Basic types - GZIP
-    print("  Generating: basic_types_gzip.parquet")
-    path = pa_dir / "basic_types_gzip.parquet"
-    pq.write_table(table, path, compression='GZIP')
-    files.append(('basic_types_gzip', str(path), 'pyarrow', 'GZIP'))
-
-    # 4. Basic types - ZSTD
-    print("  Generating: basic_types_zstd.parquet")
-    path = pa_dir / "basic_types_zstd.parquet"
-    pq.write_table(table, path, compression='ZSTD')
-    files.append(('basic_types_zstd', str(path), 'pyarrow', 'ZSTD'))
-
-    # 5. Basic types - LZ4
-    print("  Generating: basic_types_lz4.parquet")
-    path = pa_dir / "basic_types_lz4.parquet"
-    pq.write_table(table, path, compression='LZ4')
-    files.append(('basic_types_lz4', str(path), 'pyarrow', 'LZ4'))
-
-    # 6. Large dataset (1M rows)
+    for codec in ['NONE', 'SNAPPY', 'GZIP', 'ZSTD', 'LZ4']:
+        suffix = 'uncompressed' if codec == 'NONE' else codec.lower()
+        name = f'basic_types_{suffix}'
+        print(f"  Generating: {name}.parquet")
+        path = pa_dir / f"{name}.parquet"
+        pq.write_table(table, path, compression=codec)
+        files.append((name, str(path), 'pyarrow', codec))
+
+    # 6. Large dataset (1M rows) - the hottest step in this generator, so
+    # prefer DuckDB's COPY which generates and ZSTD-encodes entirely in C++
     print("  Generating: large_dataset.parquet")
-    import numpy as np
     n = 1_000_000
-    large_table = pa.table({
-        'id': pa.array(range(n), type=pa.int64()),
-        'value': pa.array(np.random.randn(n), type=pa.float64()),
-        'category': pa.array([f'cat_{i % 100}' for i in range(n)], type=pa.string()),
-    })
     path = pa_dir / "large_dataset.parquet"
-    pq.write_table(large_table, path, compression='ZSTD', row_group_size=100000)
-    files.append(('large_dataset', str(path), 'pyarrow', 'ZSTD'))
-
-    # 7. Dictionary encoding
+    if 'duckdb' in AVAILABLE_LIBS:
+        duckdb.execute(f"""
+            COPY (
+                SELECT
+                    i::BIGINT as id,
+                    random() as value,
+                    'cat_' || (i % 100) as category
+                FROM range({n}) t(i)
+            ) TO '{path}' (FORMAT PARQUET, COMPRESSION ZSTD, ROW_GROUP_SIZE 100000)
+        """)
+        files.append(('large_dataset', str(path), 'duckdb', 'ZSTD'))
+    else:
+        pq.write_table(make_large_table(n), path,
+                       compression='ZSTD', row_group_size=100000)
+        files.append(('large_dataset', str(path), 'pyarrow', 'ZSTD'))
+
+    # 7. Dictionary encoding - build the repeating pattern as an explicit
+    # dictionary array rather than having Arrow hash 6000 Python strings
     print("  Generating: dictionary_encoded.parquet")
     dict_table = pa.table({
-        'category': pa.array(['A', 'B', 'A', 'C', 'B', 'A'] * 1000, type=pa.string()),
-        'value': pa.array(range(6000), type=pa.int32()),
+        'category': pa.DictionaryArray.from_arrays(
+            pa.array(np.tile([0, 1, 0, 2, 1, 0], 1000), type=pa.int32()),
+            pa.array(['A', 'B', 'C'], type=pa.string())),
+        'value': pa.array(np.arange(6000, dtype=np.int32)),
     })
     path = pa_dir / "dictionary_encoded.parquet"
     pq.write_table(dict_table, path, use_dictionary=True)
@@ -117,7 +122,7 @@ def generate_pyarrow_files(output_dir: Path):
     # 8. Multiple row groups
     print("  Generating: multiple_row_groups.parquet")
     path = pa_dir / "multiple_row_groups.parquet"
-    pq.write_table(large_table[:100000], path, row_group_size=10000)
+    pq.write_table(make_large_table(100000), path, row_group_size=10000)
     files.append(('multiple_row_groups', str(path), 'pyarrow', 'NONE'))
 
     # 9. All null column
@@ -178,8 +183,8 @@ def generate_pyarrow_files(output_dir: Path):
     # 14. Delta encoding (integers with small deltas)
     print("  Generating: delta_encoded.parquet")
     delta_table = pa.table({
-        'sequential': pa.array(range(10000), type=pa.int64()),
-        'timestamps': pa.array([1704067200 + i for i in range(10000)], type=pa.int64()),
+        'sequential': pa.array(np.arange(10000, dtype=np.int64)),
+        'timestamps': pa.array(np.arange(1704067200, 1704067200 + 10000, dtype=np.int64)),
     })
     path = pa_dir / "delta_encoded.parquet"
     pq.write_table(delta_table, path, use_dictionary=False)
@@ -282,17 +287,19 @@ def main():
     print(f"Available libraries: {AVAILABLE_LIBS}")
     print()
 
+    # The three producers are independent and write to separate
+    # subdirectories, so run them in parallel processes
+    generators = [
+        generate_pyarrow_files,
+        generate_duckdb_files,
+        generate_fastparquet_files,
+    ]
+    print("Generating PyArrow, DuckDB, and fastparquet files in parallel...")
     all_files = []
-
-    # Generate files with each library
-    print("Generating PyArrow files...")
-    all_files.extend(generate_pyarrow_files(output_dir))
-
-    print("\nGenerating DuckDB files...")
-    all_files.extend(generate_duckdb_files(output_dir))
-
-    print("\nGenerating fastparquet files...")
-    all_files.extend(generate_fastparquet_files(output_dir))
+    with ProcessPoolExecutor(max_workers=len(generators)) as pool:
+        futures = [pool.submit(generator, output_dir) for generator in generators]
+        for future in futures:
+            all_files.extend(future.result())
 
     # Write manifest
     manifest = {
@@ -72,7 +72,57 @@ static void generate_test_data(
     }
 }
 
-static int write_test_file(const char* path, carquet_compression_t codec) {
+/* Test data shared across all compression variants (filled once) */
+typedef struct {
+    uint8_t* bools;
+    int32_t* int32s;
+    int64_t* int64s;
+    float* floats;
+    double* doubles;
+    carquet_byte_array_t* strings;
+    int16_t* string_def_levels;
+    int32_t* nullable_ints;
+    int16_t* nullable_def_levels;
+} test_data_t;
+
+static int test_data_init(test_data_t* data) {
+    data->bools = malloc(NUM_ROWS * sizeof(uint8_t));
+    data->int32s = malloc(NUM_ROWS * sizeof(int32_t));
+    data->int64s = malloc(NUM_ROWS * sizeof(int64_t));
+    data->floats = malloc(NUM_ROWS * sizeof(float));
+    data->doubles = malloc(NUM_ROWS * sizeof(double));
+    data->strings = malloc(NUM_ROWS * sizeof(carquet_byte_array_t));
+    data->string_def_levels = malloc(NUM_ROWS * sizeof(int16_t));
+    data->nullable_ints = malloc(NUM_ROWS * sizeof(int32_t));
+    data->nullable_def_levels = malloc(NUM_ROWS * sizeof(int16_t));
+
+    if (!data->bools || !data->int32s || !data->int64s || !data->floats ||
+        !data->doubles || !data->strings || !data->string_def_levels ||
+        !data->nullable_ints || !data->nullable_def_levels) {
+        return 1;
+    }
+
+    generate_test_data(data->bools, data->int32s, data->int64s,
+                       data->floats, data->doubles,
+                       data->strings, data->string_def_levels,
+                       data->nullable_ints, data->nullable_def_levels, NUM_ROWS);
+    return 0;
+}
+
+static void test_data_free(test_data_t* data) {
+    free(data->bools);
+    free(data->int32s);
+    free(data->int64s);
+    free(data->floats);
+    free(data->doubles);
+    free(data->strings);
+    free(data->string_def_levels);
+    free(data->nullable_ints);
+    free(data->nullable_def_levels);
+}
+
+static int write_test_file(const char* path, carquet_compression_t codec,
+                           const test_data_t* data) {
     carquet_error_t err = CARQUET_ERROR_INIT;
 
     carquet_schema_t* schema = carquet_schema_create(&err);
@@ -106,41 +156,17 @@ static int write_test_file(const char* path, carquet_compression_t codec) {
         return 1;
     }
 
-    /* Allocate test data */
-    uint8_t* bools = malloc(NUM_ROWS * sizeof(uint8_t));
-    int32_t* int32s = malloc(NUM_ROWS * sizeof(int32_t));
-    int64_t* int64s = malloc(NUM_ROWS * sizeof(int64_t));
-    float* floats = malloc(NUM_ROWS * sizeof(float));
-    double* doubles = malloc(NUM_ROWS * sizeof(double));
-    carquet_byte_array_t* strings = malloc(NUM_ROWS * sizeof(carquet_byte_array_t));
-    int16_t* string_def_levels = malloc(NUM_ROWS * sizeof(int16_t));
-    int32_t* nullable_ints = malloc(NUM_ROWS * sizeof(int32_t));
-    int16_t* nullable_def_levels = malloc(NUM_ROWS * sizeof(int16_t));
-
-    generate_test_data(bools, int32s, int64s, floats, doubles,
-                       strings, string_def_levels,
-                       nullable_ints, nullable_def_levels, NUM_ROWS);
-
-    /* Write all columns */
-    (void)carquet_writer_write_batch(writer, 0, bools, NUM_ROWS, NULL, NULL);
-    (void)carquet_writer_write_batch(writer, 1, int32s, NUM_ROWS, NULL, NULL);
-    (void)carquet_writer_write_batch(writer, 2, int64s, NUM_ROWS, NULL, NULL);
-    (void)carquet_writer_write_batch(writer, 3, floats, NUM_ROWS, NULL, NULL);
-    (void)carquet_writer_write_batch(writer, 4, doubles, NUM_ROWS, NULL, NULL);
-    (void)carquet_writer_write_batch(writer, 5, strings, NUM_ROWS, string_def_levels, NULL);
-    (void)carquet_writer_write_batch(writer, 6, nullable_ints, NUM_ROWS, nullable_def_levels, NULL);
+    /* Write all columns from the shared buffers */
+    (void)carquet_writer_write_batch(writer, 0, data->bools, NUM_ROWS, NULL, NULL);
+    (void)carquet_writer_write_batch(writer, 1, data->int32s, NUM_ROWS, NULL, NULL);
+    (void)carquet_writer_write_batch(writer, 2, data->int64s, NUM_ROWS, NULL, NULL);
+    (void)carquet_writer_write_batch(writer, 3, data->floats, NUM_ROWS, NULL, NULL);
+    (void)carquet_writer_write_batch(writer, 4, data->doubles, NUM_ROWS, NULL, NULL);
+    (void)carquet_writer_write_batch(writer, 5, data->strings, NUM_ROWS, data->string_def_levels, NULL);
+    (void)carquet_writer_write_batch(writer, 6, data->nullable_ints, NUM_ROWS, data->nullable_def_levels, NULL);
 
     carquet_status_t status = carquet_writer_close(writer);
 
-    free(bools);
-    free(int32s);
-    free(int64s);
-    free(floats);
-    free(doubles);
-    free(strings);
-    free(string_def_levels);
-    free(nullable_ints);
-    free(nullable_def_levels);
     carquet_schema_free(schema);
 
     return (status == CARQUET_OK) ? 0 : 1;
@@ -154,10 +180,27 @@ int main(int argc, char** argv) {
         return 1;
     }
 
-    /* Output JSON with expected values for verification */
-    printf("{\n");
-    printf("  \"num_rows\": %d,\n", NUM_ROWS);
-    printf("  \"files\": [\n");
+    /* Fill the test data once; all compression variants write the same
+     * buffers instead of regenerating them per file */
+    test_data_t data;
+    if (test_data_init(&data) != 0) {
+        fprintf(stderr, "Failed to allocate test data\n");
+        return 1;
+    }
+
+    /* Expected values go to a JSON sidecar next to the test files, so the
+     * verifier loads a file instead of parsing our stdout */
+    char json_path[512];
+    snprintf(json_path, sizeof(json_path), "%s/expected.json", output_dir);
+    FILE* out = fopen(json_path, "w");
+    if (!out) {
+        fprintf(stderr, "Failed to open %s\n", json_path);
+        return 1;
+    }
+
+    fprintf(out, "{\n");
+    fprintf(out, "  \"num_rows\": %d,\n", NUM_ROWS);
+    fprintf(out, "  \"files\": [\n");
 
     int first = 1;
     for (int c = 0; c < NUM_COMPRESSIONS; c++) {
@@ -165,39 +208,43 @@ int main(int argc, char** argv) {
         snprintf(path, sizeof(path), "%s/carquet_%s.parquet",
                  output_dir, COMPRESSION_NAMES[c]);
 
-        if (write_test_file(path, COMPRESSIONS[c]) != 0) {
+        if (write_test_file(path, COMPRESSIONS[c], &data) != 0) {
             fprintf(stderr, "Failed to write %s\n", path);
             continue;
         }
 
-        if (!first) printf(",\n");
+        if (!first) fprintf(out, ",\n");
         first = 0;
 
-        printf("    {\n");
-        printf("      \"path\": \"%s\",\n", path);
-        printf("      \"compression\": \"%s\",\n", COMPRESSION_NAMES[c]);
-        printf("      \"columns\": {\n");
-        printf("        \"bool_col\": { \"first\": [true, false, true, false, true], \"type\": \"bool\" },\n");
-        printf("        \"int32_col\": { \"first\": [-5000, -4990, -4980, -4970, -4960], \"type\": \"int32\" },\n");
-        printf("        \"int64_col\": { \"first\": [-2500000000, -2499000000, -2498000000, -2497000000, -2496000000], \"type\": \"int64\" },\n");
-        printf("        \"float_col\": { \"first\": [-1250.0, -1249.5, -1249.0, -1248.5, -1248.0], \"type\": \"float\" },\n");
-        printf("        \"double_col\": { \"first\": [-312.5, -312.375, -312.25, -312.125, -312.0], \"type\": \"double\" },\n");
-        printf("        \"string_col\": { \"first\": [null, \"world\", \"carquet\", \"parquet\", \"test\"], \"null_pattern\": \"every_7th\", \"type\": \"string\" },\n");
-        printf("        \"nullable_int\": { \"first\": [null, 100, 200, 300, 400], \"null_pattern\": \"every_5th\", \"type\": \"int32\" }\n");
-        printf("      }\n");
-        printf("    }");
+        fprintf(out, "    {\n");
+        fprintf(out, "      \"path\": \"%s\",\n", path);
+        fprintf(out, "      \"compression\": \"%s\",\n", COMPRESSION_NAMES[c]);
+        fprintf(out, "      \"columns\": {\n");
+        fprintf(out, "        \"bool_col\": { \"first\": [true, false, true, false, true], \"type\": \"bool\" },\n");
+        fprintf(out, "        \"int32_col\": { \"first\": [-5000, -4990, -4980, -4970, -4960], \"type\": \"int32\" },\n");
+        fprintf(out, "        \"int64_col\": { \"first\": [-2500000000, -2499000000, -2498000000, -2497000000, -2496000000], \"type\": \"int64\" },\n");
+        fprintf(out, "        \"float_col\": { \"first\": [-1250.0, -1249.5, -1249.0, -1248.5, -1248.0], \"type\": \"float\" },\n");
+        fprintf(out, "        \"double_col\": { \"first\": [-312.5, -312.375, -312.25, -312.125, -312.0], \"type\": \"double\" },\n");
+        fprintf(out, "        \"string_col\": { \"first\": [null, \"world\", \"carquet\", \"parquet\", \"test\"], \"null_pattern\": \"every_7th\", \"type\": \"string\" },\n");
+        fprintf(out, "        \"nullable_int\": { \"first\": [null, 100, 200, 300, 400], \"null_pattern\": \"every_5th\", \"type\": \"int32\" }\n");
+        fprintf(out, "      }\n");
+        fprintf(out, "    }");
     }
 
-    printf("\n  ],\n");
-    printf("  \"verification\": {\n");
-    printf("    \"row_counts\": %d,\n", NUM_ROWS);
-    printf("    \"null_count_string_col\": %d,\n", (NUM_ROWS + 6) / 7);
-    printf("    \"null_count_nullable_int\": %d,\n", (NUM_ROWS + 4) / 5);
-    printf("    \"bool_true_count\": %d,\n", (NUM_ROWS + 1) / 2);
-    printf("    \"int32_sum\": %lld,\n", (long long)((NUM_ROWS - 1) * NUM_ROWS / 2 * 10 - 5000LL * NUM_ROWS));
-    printf("    \"last_int32\": %d\n", (NUM_ROWS - 1) * 10 - 5000);
-    printf("  }\n");
-    printf("}\n");
+    fprintf(out, "\n  ],\n");
+    fprintf(out, "  \"verification\": {\n");
+    fprintf(out, "    \"row_counts\": %d,\n", NUM_ROWS);
+    fprintf(out, "    \"null_count_string_col\": %d,\n", (NUM_ROWS + 6) / 7);
+    fprintf(out, "    \"null_count_nullable_int\": %d,\n", (NUM_ROWS + 4) / 5);
+    fprintf(out, "    \"bool_true_count\": %d,\n", (NUM_ROWS + 1) / 2);
+    fprintf(out, "    \"int32_sum\": %lld,\n", (long long)((NUM_ROWS - 1) * NUM_ROWS / 2 * 10 - 5000LL * NUM_ROWS));
+    fprintf(out, "    \"last_int32\": %d\n", (NUM_ROWS - 1) * 10 - 5000);
+    fprintf(out, "  }\n");
+    fprintf(out, "}\n");
+
+    test_data_free(&data);
+    fclose(out);
+    printf("%s\n", json_path);
 
     return 0;
 }